@@ -481,7 +481,10 @@ def _quantize(
         q_min,
         q_max,
     )
-    quantized_value = round_to_quantized_type(clamped_value, args)
+    # skip the cast back to the input dtype when casting to a storage dtype anyway
+    quantized_value = round_to_quantized_type(
+        clamped_value, args, return_quantized_dtype=dtype is not None
+    )
 
     if dtype is not None:
         quantized_value = quantized_value.to(dtype)
@@ -14,10 +14,9 @@
 
 
 import logging
-import math
 import warnings
 from enum import Enum
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 import torch
 from compressed_tensors.quantization.lifecycle.forward import (
@@ -31,10 +30,11 @@ from compressed_tensors.quantization.quant_args import (
 )
 from compressed_tensors.quantization.quant_config import QuantizationStatus
 from compressed_tensors.quantization.quant_scheme import QuantizationScheme
-from compressed_tensors.quantization.utils import is_fp4, is_kv_cache_quant_scheme
+from compressed_tensors.quantization.utils import is_kv_cache_quant_scheme
 from compressed_tensors.utils import (
     disable_hf_hook,
     get_execution_device,
+    has_offloaded_params,
     register_offload_parameter,
 )
 from torch.nn import Module, Parameter
@@ -42,6 +42,7 @@ from torch.nn import Module, Parameter
 
 __all__ = [
     "initialize_module_for_quantization",
+    "initialize_model_for_quantization",
     "is_attention_module",
     "KVCacheScaleType",
 ]
@@ -49,6 +50,13 @@ __all__ = [
 
 _LOGGER = logging.getLogger(__name__)
 
+_VALID_SCALE_DTYPES = frozenset(
+    {torch.float16, torch.bfloat16, torch.float32, torch.float64}
+)
+
+# module class -> whether its name marks it as an attention module
+_ATTENTION_CLASS_CACHE: Dict[type, bool] = {}
+
 
 class KVCacheScaleType(Enum):
     KEY = "k_scale"
@@ -60,6 +68,8 @@ def initialize_module_for_quantization(
     scheme: Optional[QuantizationScheme] = None,
     force_zero_point: bool = True,
     scale_dtype: Optional[torch.dtype] = None,
+    execution_device: Optional[torch.device] = None,
+    zero_init_zero_point: bool = True,
 ):
     """
     attaches appropriate scales, zero points, and observers to a layer
@@ -75,16 +85,108 @@ def initialize_module_for_quantization(
         symmetric quantization
     :param scale_dtype: dtype to used for the scales, if overriding the
         weight dtype as the scale dtype
+    :param execution_device: device to initialize quantization parameters on. If
+        None is provided, the execution device of the module is used
+    :param zero_init_zero_point: whether to fill zero points with zeros. Set to False
+        only if zero points will be overwritten before they are used, such as by
+        calibration
+    """
+    scheme = _initialize_module_qparams(
+        module,
+        scheme=scheme,
+        force_zero_point=force_zero_point,
+        scale_dtype=scale_dtype,
+        execution_device=execution_device,
+        zero_init_zero_point=zero_init_zero_point,
+    )
+    if scheme is not None:
+        with disable_hf_hook(module):
+            # wrap forward call of module to perform
+            # quantized actions based on calltime status
+            wrap_module_forward_quantized(module, scheme)
+
+
+def initialize_model_for_quantization(
+    model: Module,
+    force_zero_point: bool = True,
+    scale_dtype: Optional[torch.dtype] = None,
+    zero_init_zero_point: bool = True,
+):
+    """
+    attaches appropriate scales, zero points, and observers to all layers of a model
+    which have a `quantization_scheme` attached
+
+    If all layers of the model execute on the same device, the execution device is
+    resolved once and shared by all layers. Otherwise, it is resolved per layer
+
+    :param model: model to set for calibration
+    :param force_zero_point: whether to force initialization of a zero point for
+        symmetric quantization
+    :param scale_dtype: dtype to used for the scales, if overriding the
+        weight dtype as the scale dtype
+    :param zero_init_zero_point: whether to fill zero points with zeros. Set to False
+        only if zero points will be overwritten before they are used, such as by
+        calibration
+    """
+    execution_device = _get_shared_execution_device(model)
+
+    # parameters must be registered with hooks attached so that they are offloaded
+    to_wrap = []
+    for module in model.modules():
+        scheme = _initialize_module_qparams(
+            module,
+            force_zero_point=force_zero_point,
+            scale_dtype=scale_dtype,
+            execution_device=execution_device,
+            zero_init_zero_point=zero_init_zero_point,
+        )
+        if scheme is not None:
+            to_wrap.append((module, scheme))
+
+    # remove and re-add hooks once for the whole model rather than per module
+    with disable_hf_hook(model):
+        for module, scheme in to_wrap:
+            wrap_module_forward_quantized(module, scheme)
+
+
+def is_attention_module(module: Module):
+    cls = module.__class__
+    is_attention_cls = _ATTENTION_CLASS_CACHE.get(cls)
+    if is_attention_cls is None:
+        is_attention_cls = "attention" in cls.__name__.lower()
+        _ATTENTION_CLASS_CACHE[cls] = is_attention_cls
+
+    return is_attention_cls and (
+        hasattr(module, "k_proj")
+        or hasattr(module, "v_proj")
+        or hasattr(module, "qkv_proj")
+    )
+
+
+def _initialize_module_qparams(
+    module: Module,
+    scheme: Optional[QuantizationScheme] = None,
+    force_zero_point: bool = True,
+    scale_dtype: Optional[torch.dtype] = None,
+    execution_device: Optional[torch.device] = None,
+    zero_init_zero_point: bool = True,
+) -> Optional[QuantizationScheme]:
+    """
+    attaches quantization parameters to a layer without wrapping its forward
+
+    :return: scheme which the forward of the module should be wrapped with, or None
+        if the forward should be left as is
     """
     # TODO: don't initialize parameters when running decompression
     scheme = scheme or getattr(module, "quantization_scheme", None)
     if scheme is None:
         # no scheme passed and layer not targeted for quantization - skip
-        return
+        return None
 
     if is_attention_module(module):
         # quantized actions based on calltime status
         _initialize_attn_scales(module)
+        return None
 
     else:
 
@@ -95,6 +197,8 @@ def initialize_module_for_quantization(
                 scheme.input_activations,
                 force_zero_point=force_zero_point,
                 scale_dtype=scale_dtype,
+                execution_device=execution_device,
+                zero_init_zero_point=zero_init_zero_point,
             )
 
         if scheme.weights is not None:
@@ -109,6 +213,8 @@ def initialize_module_for_quantization(
                     weight_shape=weight_shape,
                     force_zero_point=force_zero_point,
                     scale_dtype=scale_dtype,
+                    execution_device=execution_device,
+                    zero_init_zero_point=zero_init_zero_point,
                 )
             else:
                 _LOGGER.warning(
@@ -120,24 +226,46 @@ def initialize_module_for_quantization(
         if scheme.output_activations is not None:
             if not is_kv_cache_quant_scheme(scheme):
                 _initialize_scale_zero_point(
-                    module, "output", scheme.output_activations, scale_dtype=scale_dtype
+                    module,
+                    "output",
+                    scheme.output_activations,
+                    scale_dtype=scale_dtype,
+                    execution_device=execution_device,
+                    zero_init_zero_point=zero_init_zero_point,
                 )
 
         module.quantization_scheme = scheme
         module.quantization_status = QuantizationStatus.INITIALIZED
 
-        with disable_hf_hook(module):
-            # wrap forward call of module to perform
-            # quantized actions based on calltime status
-            wrap_module_forward_quantized(module, scheme)
+        # a scheme without any quantization args makes the wrapped forward a
+        # passthrough, so avoid the extra call overhead on every forward pass
+        if (
+            scheme.input_activations is None
+            and scheme.weights is None
+            and scheme.output_activations is None
+        ):
+            return None
 
+        return scheme
 
-def is_attention_module(module: Module):
-    return "attention" in module.__class__.__name__.lower() and (
-        hasattr(module, "k_proj")
-        or hasattr(module, "v_proj")
-        or hasattr(module, "qkv_proj")
-    )
+
+def _get_shared_execution_device(model: Module) -> Optional[torch.device]:
+    """
+    :param model: model whose layers may be offloaded or dispatched across devices
+    :return: execution device shared by all layers of the model, or None if layers
+        execute on different devices
+    """
+    devices = set()
+    for module in model.modules():
+        if has_offloaded_params(module):
+            devices.add(torch.device(module._hf_hook.execution_device))
+        else:
+            devices.update(param.device for param in module.parameters(recurse=False))
+
+        if len(devices) > 1:
+            return None
+
+    return next(iter(devices), None)
 
 
 def _initialize_scale_zero_point(
@@ -147,12 +275,17 @@ def _initialize_scale_zero_point(
     weight_shape: Optional[torch.Size] = None,
     force_zero_point: bool = True,
     scale_dtype: Optional[torch.dtype] = None,
+    execution_device: Optional[torch.device] = None,
+    zero_init_zero_point: bool = True,
 ):
     if quantization_args.dynamic is True:
         return
 
     # initialize on execution device to avoid performing quantized ops on cpu
-    device = get_execution_device(module)
+    if execution_device is not None:
+        device = execution_device
+    else:
+        device = get_execution_device(module)
 
     # 1. Create global_scales for tensor_group - generates
     # a per tensor scale
@@ -166,67 +299,25 @@ def _initialize_scale_zero_point(
         )
 
     # 2. Infer expected scale/zero point shape
-    if quantization_args.strategy == QuantizationStrategy.TOKEN:
-        expected_shape = (1, 1)
-    else:
-        expected_shape = 1
-
-    if base_name == "weight" and weight_shape is not None:
-        if quantization_args.strategy == QuantizationStrategy.CHANNEL:
-            # (output_channels, 1) - only for weights
-            expected_shape = (weight_shape[0], 1)
-        elif quantization_args.strategy in (
-            QuantizationStrategy.TENSOR_GROUP,
-            QuantizationStrategy.GROUP,
-        ):
-            # GROUP/TENSOR_GROUP for both weights and activations
-            num_groups = math.ceil(weight_shape[1] / quantization_args.group_size)
-            expected_shape = (weight_shape[0], max(num_groups, 1))
-        elif quantization_args.strategy == QuantizationStrategy.BLOCK:
-            # For block quantization, scale shape should match number of blocks - only for weights
-            if quantization_args.block_structure is None:
-                raise ValueError("Block quantization requires block_structure to be specified")
-            block_height, block_width = quantization_args.block_structure
-            rows, cols = weight_shape[-2], weight_shape[-1]
-            num_rows_blocks = math.ceil(rows / block_height)
-            num_cols_blocks = math.ceil(cols / block_width)
-            
-            # Warn if dimensions don't divide evenly
-            if rows % block_height != 0 or cols % block_width != 0:
-                warnings.warn(
-                    f"Block quantization: tensor shape {weight_shape} does not divide evenly "
-                    f"by block structure {quantization_args.block_structure}. "
-                    f"Some blocks will be incomplete which may affect quantization quality.",
-                    UserWarning
-                )
-            
-            expected_shape = (num_rows_blocks, num_cols_blocks)
-    elif quantization_args.strategy == QuantizationStrategy.BLOCK:
-        warnings.warn(
-            f"BLOCK quantization not supported for {base_name} activations. "
-            f"Falling back to tensor-level quantization.",
-            UserWarning
-        )
-        expected_shape = 1
+    expected_shape = _EXPECTED_SHAPE_FNS[quantization_args.strategy](
+        base_name, weight_shape, quantization_args
+    )
 
     # 3. Identify quantization scale and zp dtype
     scale_dtype = scale_dtype if scale_dtype is not None else module.weight.dtype
 
-    if is_fp4(quantization_args=quantization_args):
-        scale_dtype = zp_dtype = FP8_E4M3_DATA.dtype
+    zp_dtype = quantization_args.zp_dtype
+    if quantization_args.is_fp4:
+        scale_dtype = FP8_E4M3_DATA.dtype
     else:
         # TODO: consider erroring out in the future as if the dtype if not one of these,
         # there is likely bug
-        if scale_dtype not in [
-            torch.float16,
-            torch.bfloat16,
-            torch.float32,
-            torch.float64,
-        ]:
+        if scale_dtype not in _VALID_SCALE_DTYPES:
             scale_dtype = torch.float16
-        zp_dtype = quantization_args.pytorch_dtype()
 
     # 4. Initializes empty scale, zero point, and g_idx parameters for the module
+    # each qparam owns its storage: views into a shared buffer would be treated as
+    # tied tensors when saving and cannot be serialized with safetensors
     # do not init scales for quantzation_args.dynamic == DynamicType.local
     if not quantization_args.dynamic:
         init_scale = Parameter(
@@ -235,9 +326,10 @@ def _initialize_scale_zero_point(
         )
         register_offload_parameter(module, f"{base_name}_scale", init_scale)
 
-    if force_zero_point or not quantization_args.symmetric:
+    if force_zero_point or quantization_args.requires_zero_point:
+        zp_init_fn = torch.zeros if zero_init_zero_point else torch.empty
         init_zero_point = Parameter(
-            torch.zeros(expected_shape, device=device, dtype=zp_dtype),
+            zp_init_fn(expected_shape, device=device, dtype=zp_dtype),
             requires_grad=False,
         )
         register_offload_parameter(module, f"{base_name}_zero_point", init_zero_point)
@@ -258,7 +350,14 @@ def _initialize_attn_scales(module: Module) -> None:
 
     expected_shape = 1  # per tensor
 
-    param = next(module.parameters())
+    param = getattr(module, "weight", None)
+    if not isinstance(param, torch.Tensor):
+        # attention modules usually expose their projections directly
+        proj = getattr(module, "q_proj", None) or getattr(module, "qkv_proj", None)
+        if isinstance(proj, torch.nn.Linear):
+            param = proj.weight
+        else:
+            param = next(module.parameters())
     scale_dtype = param.dtype
     device = param.device
 
@@ -273,3 +372,84 @@ def _initialize_attn_scales(module: Module) -> None:
         requires_grad=False,
     )
     register_offload_parameter(module, KVCacheScaleType.VALUE.value, init_scale)
+
+
+def _tensor_qparam_shape(
+    base_name: str, weight_shape: Optional[torch.Size], args: QuantizationArgs
+) -> Union[int, Tuple[int, ...]]:
+    return 1
+
+
+def _token_qparam_shape(
+    base_name: str, weight_shape: Optional[torch.Size], args: QuantizationArgs
+) -> Union[int, Tuple[int, ...]]:
+    return (1, 1)
+
+
+def _channel_qparam_shape(
+    base_name: str, weight_shape: Optional[torch.Size], args: QuantizationArgs
+) -> Union[int, Tuple[int, ...]]:
+    if base_name != "weight" or weight_shape is None:
+        return 1
+
+    # (output_channels, 1) - only for weights
+    return (weight_shape[0], 1)
+
+
+def _group_qparam_shape(
+    base_name: str, weight_shape: Optional[torch.Size], args: QuantizationArgs
+) -> Union[int, Tuple[int, ...]]:
+    if base_name != "weight" or weight_shape is None:
+        return 1
+
+    # GROUP/TENSOR_GROUP for both weights and activations
+    columns = int(weight_shape[1])
+    num_groups = (columns + args.group_size - 1) // args.group_size
+    return (weight_shape[0], max(num_groups, 1))
+
+
+def _block_qparam_shape(
+    base_name: str, weight_shape: Optional[torch.Size], args: QuantizationArgs
+) -> Union[int, Tuple[int, ...]]:
+    if base_name != "weight" or weight_shape is None:
+        warnings.warn(
+            f"BLOCK quantization not supported for {base_name} activations. "
+            f"Falling back to tensor-level quantization.",
+            UserWarning,
+        )
+        return 1
+
+    # For block quantization, scale shape should match number of blocks - only for weights
+    if args.block_structure is None:
+        raise ValueError("Block quantization requires block_structure to be specified")
+    block_height, block_width = args.block_structure
+    rows, cols = int(weight_shape[-2]), int(weight_shape[-1])
+    num_rows_blocks = (rows + block_height - 1) // block_height
+    num_cols_blocks = (cols + block_width - 1) // block_width
+
+    # Warn if dimensions don't divide evenly
+    if rows % block_height != 0 or cols % block_width != 0:
+        warnings.warn(
+            f"Block quantization: tensor shape {weight_shape} does not divide evenly "
+            f"by block structure {args.block_structure}. "
+            f"Some blocks will be incomplete which may affect quantization quality.",
+            UserWarning,
+        )
+
+    return (num_rows_blocks, num_cols_blocks)
+
+
+# strategy -> fn(base_name, weight_shape, args) computing the scale/zero point shape
+_EXPECTED_SHAPE_FNS: Dict[
+    QuantizationStrategy,
+    Callable[
+        [str, Optional[torch.Size], QuantizationArgs], Union[int, Tuple[int, ...]]
+    ],
+] = {
+    QuantizationStrategy.TENSOR: _tensor_qparam_shape,
+    QuantizationStrategy.TOKEN: _token_qparam_shape,
+    QuantizationStrategy.CHANNEL: _channel_qparam_shape,
+    QuantizationStrategy.GROUP: _group_qparam_shape,
+    QuantizationStrategy.TENSOR_GROUP: _group_qparam_shape,
+    QuantizationStrategy.BLOCK: _block_qparam_shape,
+}
@@ -13,8 +13,9 @@
 # limitations under the License.
 
 import warnings
+from dataclasses import dataclass, fields
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import torch
 from compressed_tensors.utils import Aliasable
@@ -36,45 +37,80 @@ __all__ = [
 ]
 
 
+@dataclass(frozen=True)
 class FloatArgs:
+    __slots__ = ("exponent", "mantissa", "bits", "max", "min", "dtype")
+
     exponent: int
     mantissa: int
     bits: int
     max: float
     min: float
-    dtype: Optional[torch.dtype] = None
+    dtype: Optional[torch.dtype]
+
+    def __reduce__(self):
+        # frozen slotted instances cannot restore pickled state through setattr
+        return self.__class__, tuple(getattr(self, f.name) for f in fields(self))
+
+
+# rounding boundaries between consecutive fp4 magnitudes and the magnitudes
+# themselves, cached per (device, dtype) on first use
+_FP4_EDGES = torch.tensor([0.25, 0.75, 1.25, 1.75, 2.5, 3.5, 5.0])
+_FP4_VALUES = torch.tensor([0.0, 0.5, 1.0, 1.5, 2.0, 3.0, 4.0, 6.0])
+_FP4_LUT_CACHE: Dict[Tuple[torch.device, torch.dtype], Tuple[torch.Tensor, ...]] = {}
 
 
-class FP4_E2M1_DATA(FloatArgs):
-    exponent = 2
-    mantissa = 1
-    bits = 4
-    max = 6.0
-    min = -6.0
+def _get_fp4_lut(
+    device: torch.device, dtype: torch.dtype
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    key = (device, dtype)
+    if key not in _FP4_LUT_CACHE:
+        _FP4_LUT_CACHE[key] = (
+            _FP4_EDGES.to(device=device, dtype=dtype),
+            _FP4_VALUES.to(device=device, dtype=dtype),
+        )
+    return _FP4_LUT_CACHE[key]
+
+
+@torch.compile
+def _cast_to_fp4(
+    x: torch.Tensor, edges: torch.Tensor, values: torch.Tensor
+) -> torch.Tensor:
+    sign = torch.sign(x)
+    x = torch.abs(x)
+    # values exactly on an edge round to the even (zero mantissa) fp4 value
+    lower = torch.bucketize(x, edges, right=False)
+    upper = torch.bucketize(x, edges, right=True)
+    idx = torch.where(lower % 2 == 0, lower, upper)
+    return values[idx] * sign
+
+
+class _FP4Args(FloatArgs):
+    __slots__ = ()
 
     @staticmethod
-    @torch.compile
     def cast_to_fp4(x):
-        sign = torch.sign(x)
-        x = torch.abs(x)
-        x[(x >= 0.0) & (x <= 0.25)] = 0.0
-        x[(x > 0.25) & (x < 0.75)] = 0.5
-        x[(x >= 0.75) & (x <= 1.25)] = 1.0
-        x[(x > 1.25) & (x < 1.75)] = 1.5
-        x[(x >= 1.75) & (x <= 2.5)] = 2.0
-        x[(x > 2.5) & (x < 3.5)] = 3.0
-        x[(x >= 3.5) & (x <= 5.0)] = 4.0
-        x[x > 5.0] = 6.0
-        return x * sign
-
-
-class FP8_E4M3_DATA(FloatArgs):
-    exponent = 4
-    mantissa = 3
-    bits = 8
-    max = torch.finfo(torch.float8_e4m3fn).max
-    min = torch.finfo(torch.float8_e4m3fn).min
-    dtype = torch.float8_e4m3fn
+        edges, values = _get_fp4_lut(x.device, x.dtype)
+        return _cast_to_fp4(x, edges, values)
+
+
+FP4_E2M1_DATA = _FP4Args(
+    exponent=2,
+    mantissa=1,
+    bits=4,
+    max=6.0,
+    min=-6.0,
+    dtype=None,
+)
+
+FP8_E4M3_DATA = FloatArgs(
+    exponent=4,
+    mantissa=3,
+    bits=8,
+    max=torch.finfo(torch.float8_e4m3fn).max,
+    min=torch.finfo(torch.float8_e4m3fn).min,
+    dtype=torch.float8_e4m3fn,
+)
 
 
 # TODO: Remove soon in favour of a more descriptive FloatArgs
@@ -143,6 +179,23 @@ class ActivationOrdering(Aliasable, str, Enum):
         }
 
 
+# lowercase value -> member tables used to coerce user strings during validation
+_TYPE_LOOKUP = {member.value: member for member in QuantizationType}
+_STRATEGY_LOOKUP = {member.value: member for member in QuantizationStrategy}
+_DYNAMIC_LOOKUP = {member.value: member for member in DynamicType}
+_ACTORDER_LOOKUP = {member.value: member for member in ActivationOrdering}
+
+
+def _coerce_enum(value: Any, lookup: Dict[str, Enum], enum_cls: type) -> Any:
+    if isinstance(value, str):
+        value = value.lower()
+        member = lookup.get(value)
+        # fall back to the enum constructor to raise the usual error
+        return member if member is not None else enum_cls(value)
+
+    return value
+
+
 class QuantizationArgs(BaseModel, use_enum_values=True):
     """
     User facing arguments used to define a quantization config for weights or
@@ -189,10 +242,7 @@ class QuantizationArgs(BaseModel, use_enum_values=True):
 
     @field_validator("type", mode="before")
     def validate_type(cls, value) -> QuantizationType:
-        if isinstance(value, str):
-            return QuantizationType(value.lower())
-
-        return value
+        return _coerce_enum(value, _TYPE_LOOKUP, QuantizationType)
 
     @field_validator("group_size", mode="before")
     def validate_group(cls, value) -> Union[int, None]:
@@ -213,8 +263,9 @@ class QuantizationArgs(BaseModel, use_enum_values=True):
             return value
         # For backward compatibility, allow string format "2x4", "8x16", etc.
         if isinstance(value, str):
+            rows, _, cols = value.partition("x")
             try:
-                return [int(x) for x in value.split("x")]
+                return [int(rows), int(cols)]
             except Exception:
                 raise ValueError(
                     f"Invalid block_structure '{value}'. Must be a list of two ints [rows, cols]."
@@ -231,26 +282,18 @@ class QuantizationArgs(BaseModel, use_enum_values=True):
 
     @field_validator("strategy", mode="before")
     def validate_strategy(cls, value) -> Union[QuantizationStrategy, None]:
-        if isinstance(value, str):
-            return QuantizationStrategy(value.lower())
-
-        return value
+        return _coerce_enum(value, _STRATEGY_LOOKUP, QuantizationStrategy)
 
     @field_validator("actorder", mode="before")
     def validate_actorder(cls, value) -> Optional[ActivationOrdering]:
         if isinstance(value, bool):
             return ActivationOrdering.GROUP if value else None
 
-        if isinstance(value, str):
-            return ActivationOrdering(value.lower())
-
-        return value
+        return _coerce_enum(value, _ACTORDER_LOOKUP, ActivationOrdering)
 
     @field_validator("dynamic", mode="before")
     def validate_dynamic(cls, value) -> Union[DynamicType, bool]:
-        if isinstance(value, str):
-            return DynamicType(value.lower())
-        return value
+        return _coerce_enum(value, _DYNAMIC_LOOKUP, DynamicType)
 
     @model_validator(mode="after")
     def validate_model_after(model: "QuantizationArgs") -> "QuantizationArgs":
@@ -354,13 +397,40 @@ class QuantizationArgs(BaseModel, use_enum_values=True):
         else:
             raise ValueError(f"Invalid quantization type {self.type}")
 
+    @property
+    def is_fp4(self) -> bool:
+        """
+        whether these args describe fp4 quantization
+        """
+        return self.num_bits == 4 and self.type == QuantizationType.FLOAT
+
+    @property
+    def requires_zero_point(self) -> bool:
+        """
+        whether quantizing with these args requires a zero point. Only asymmetric
+        quantization requires a zero point
+        """
+        return not self.symmetric
+
+    @property
+    def zp_dtype(self) -> torch.dtype:
+        """
+        dtype used to store zero points. FP4 zero points are stored in fp8,
+        otherwise this matches `pytorch_dtype()`
+        """
+        if self.is_fp4:
+            return FP8_E4M3_DATA.dtype
+        return self.pytorch_dtype()
+
     @deprecated("QuantizationArgs.observer")
     def get_observer(self) -> str:
         return self.observer
 
 
 def round_to_quantized_type(
-    tensor: torch.Tensor, args: QuantizationArgs
+    tensor: torch.Tensor,
+    args: QuantizationArgs,
+    return_quantized_dtype: bool = False,
 ) -> torch.Tensor:
     """
     Rounds each element of the input tensor to the nearest quantized representation,
@@ -368,6 +438,9 @@ def round_to_quantized_type(
 
     :param tensor: tensor to round
     :param args: QuantizationArgs to pull appropriate dtype from
+    :param return_quantized_dtype: if True, skip casting the rounded tensor back to
+        the original dtype. FP8 values are returned in fp8, other types are returned
+        in the dtype produced by rounding
     :return: rounded tensor
     """
     original_dtype = tensor.dtype
@@ -383,4 +456,6 @@ def round_to_quantized_type(
     else:
         raise ValueError(f"Invalid quantization type {args.type}")
 
+    if return_quantized_dtype or rounded.dtype is original_dtype:
+        return rounded
     return rounded.to(original_dtype)
@@ -13,8 +13,7 @@
 # limitations under the License.
 
 import warnings
-from copy import deepcopy
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from compressed_tensors.quantization.quant_args import (
     DynamicType,
@@ -22,7 +21,7 @@ from compressed_tensors.quantization.quant_args import (
     QuantizationStrategy,
     QuantizationType,
 )
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, TypeAdapter, model_validator
 
 
 __all__ = [
@@ -31,6 +30,18 @@ __all__ = [
     "is_preset_scheme",
 ]
 
+_GROUP_SIZE_MISMATCH_WARNING = (
+    "Using GROUP strategy for both weights and input_activations "
+    "with different group sizes ({} vs {}) "
+    "may complicate fused kernel implementations. Consider using "
+    "TENSOR_GROUP strategy for both or matching group sizes."
+)
+# (weights group size, inputs group size) pairs which have already been warned about
+_WARNED_GROUP_SIZE_MISMATCHES: Set[Tuple[Optional[int], Optional[int]]] = set()
+_PRESET_ARGS_FIELDS = ("weights", "input_activations", "output_activations")
+# validates targets passed to preset schemes, which are copied without validation
+_TARGETS_ADAPTER = TypeAdapter(List[str])
+
 
 class QuantizationScheme(BaseModel):
     """
@@ -51,32 +62,32 @@ class QuantizationScheme(BaseModel):
 
     @model_validator(mode="after")
     def validate_model_after(model: "QuantizationScheme") -> "QuantizationScheme":
+        weights = model.weights
         inputs = model.input_activations
         outputs = model.output_activations
-        weights = model.weights
 
-        if inputs is not None:
-            if inputs.actorder is not None:
-                raise ValueError("Cannot apply actorder to input activations")
+        if inputs is not None and inputs.actorder is not None:
+            raise ValueError("Cannot apply actorder to input activations")
 
-        if outputs is not None:
-            if outputs.actorder is not None:
-                raise ValueError("Cannot apply actorder to output activations")
+        if outputs is not None and outputs.actorder is not None:
+            raise ValueError("Cannot apply actorder to output activations")
 
         if (
-            inputs and weights
-            and weights.strategy == QuantizationStrategy.GROUP 
+            inputs is not None
+            and weights is not None
+            and weights.strategy == QuantizationStrategy.GROUP
             and inputs.strategy == QuantizationStrategy.GROUP
             and weights.group_size != inputs.group_size
         ):
-            warnings.warn(
-                "Using GROUP strategy for both weights and input_activations "
-                f"with different group sizes ({weights.group_size} vs {inputs.group_size}) "
-                "may complicate fused kernel implementations. Consider using "
-                "TENSOR_GROUP strategy for both or matching group sizes.",
-                UserWarning,
-                stacklevel=2
-            )
+            # only warn once per pair of group sizes
+            group_sizes = (weights.group_size, inputs.group_size)
+            if group_sizes not in _WARNED_GROUP_SIZE_MISMATCHES:
+                _WARNED_GROUP_SIZE_MISMATCHES.add(group_sizes)
+                warnings.warn(
+                    _GROUP_SIZE_MISMATCH_WARNING.format(*group_sizes),
+                    UserWarning,
+                    stacklevel=2,
+                )
 
         return model
 
@@ -101,11 +112,34 @@ def preset_name_to_scheme(name: str, targets: List[str]) -> QuantizationScheme:
             f"available names: {list(PRESET_SCHEMES.keys())}"
         )
 
-    scheme_args = deepcopy(PRESET_SCHEMES[name])  # deepcopy to avoid args references
-    return QuantizationScheme(
-        targets=targets,
-        **scheme_args,
-    )
+    # copy args to avoid sharing references with the cached preset scheme
+    template = _preset_scheme_template(name)
+    update = {"targets": _TARGETS_ADAPTER.validate_python(targets)}
+    for field in _PRESET_ARGS_FIELDS:
+        args = getattr(template, field)
+        if args is not None:
+            update[field] = args.model_copy(deep=True)
+
+    return template.model_copy(update=update)
+
+
+def _preset_scheme_template(name: str) -> QuantizationScheme:
+    preset = PRESET_SCHEMES[name]
+    template = _PRESET_SCHEME_TEMPLATES.get(name)
+
+    # templates reference the preset args, so a preset which has been replaced or
+    # has had its args reassigned no longer matches its template
+    if template is None or any(
+        getattr(template, field) is not preset.get(field)
+        for field in _PRESET_ARGS_FIELDS
+    ):
+        # presets hold already validated args, so only the scheme invariants need
+        # to be checked. Callers receive copies with their own targets
+        template = QuantizationScheme.model_construct(targets=[], **preset)
+        template = QuantizationScheme.validate_model_after(template)
+        _PRESET_SCHEME_TEMPLATES[name] = template
+
+    return template
 
 
 def is_preset_scheme(name: str) -> bool:
@@ -301,3 +335,9 @@ PRESET_SCHEMES = {
     "NVFP4A16": NVFP4A16,
     "NVFP4": NVFP4,
 }
+
+# preset name -> scheme with empty targets, built on import
+_PRESET_SCHEME_TEMPLATES: Dict[str, QuantizationScheme] = {}
+for _name in PRESET_SCHEMES:
+    _preset_scheme_template(_name)
+del _name
@@ -13,7 +13,11 @@
 # limitations under the License.
 
 import torch
-from compressed_tensors.transform import TransformConfig, TransformFactory
+from compressed_tensors.transform import (
+    HadamardFactory,
+    TransformConfig,
+    TransformFactory,
+)
 
 
 __all__ = ["apply_transform_config"]
@@ -27,6 +31,14 @@ def apply_transform_config(model: torch.nn.Module, config: TransformConfig):
     :param model: model to apply config to
     :param config: transform config to apply
     """
+    # deterministic hadamard weights are shared between the schemes of this model
+    shared_weights = {}
+
     for name, scheme in config.config_groups.items():
-        factory = TransformFactory.from_scheme(scheme, name=name)
+        kwargs = {"name": name}
+        constructor = TransformFactory.get_value_from_registry(name=scheme.type)
+        if issubclass(constructor, HadamardFactory):
+            kwargs["shared_weights"] = shared_weights
+
+        factory = TransformFactory.from_scheme(scheme, **kwargs)
         factory.apply_to_model(model)
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Optional, Union
+from typing import Dict, Optional, Tuple, Union
 
 import math
 import torch
@@ -37,12 +37,24 @@ class HadamardFactory(TransformFactory):
     :param name: name associated with transform scheme
     :param scheme: transform scheme which defines how transforms should be created
     :param seed: random seed used to transform weight randomization
+    :param shared_weights: optional cache of deterministic weights, keyed by size,
+        dtype, and device, which is shared with other factories applied to the same
+        model
     """
 
-    def __init__(self, name: str, scheme: TransformScheme, seed: Optional[int] = None):
+    # whether `_create_weight` produces the same matrix for every factory
+    _deterministic_weight: bool = True
+
+    def __init__(
+        self,
+        name: str,
+        scheme: TransformScheme,
+        seed: Optional[int] = None,
+        shared_weights: Optional[Dict[Tuple[int, dtype, device], Parameter]] = None,
+    ):
         super().__init__(name, scheme, seed)
-        self.weights = ParameterizedDefaultDict(self._create_weight)
-        self.perms = ParameterizedDefaultDict(self._create_permutation)
+        self.weights = ParameterizedDefaultDict(self._create_transform_weight)
+        self.shared_weights = shared_weights
 
     def create_transform(self, module: Module, args: TransformArgs):
         """
@@ -60,50 +72,68 @@ class HadamardFactory(TransformFactory):
 
         factory_kwargs = {"construct_device": exec_device}
         weight = self.weights.get(size, dtype, device, factory_kwargs=factory_kwargs)
-        perm = self.perms[weight] if self.scheme.randomize else None
-        return HadamardTransform(weight, perm, args, type(module))
+        return HadamardTransform(weight, args, type(module))
 
-    def _create_weight(
+    def _create_transform_weight(
         self,
         size: int,
         dtype: dtype,
         device: device,
         construct_device: device,
     ) -> Parameter:
+        # weights which are identical across factories and are never updated can be
+        # shared with other factories
+        shareable = (
+            self.shared_weights is not None
+            and self._deterministic_weight
+            and not (self.scheme.randomize or self.scheme.requires_grad)
+        )
+        if shareable and (size, dtype, device) in self.shared_weights:
+            return self.shared_weights[(size, dtype, device)]
+
         # construct on execution device, cache on offload device
-        data = deterministic_hadamard_matrix(size, dtype, construct_device)
-        data = data.to(device=device)
-        return Parameter(data, requires_grad=self.scheme.requires_grad)
+        data = self._create_weight(size, dtype, construct_device)
+        if self.scheme.randomize:
+            # permute once upon creation rather than with every forward pass
+            perm = self._create_permutation(size).to(construct_device)
+            data = data.index_select(0, perm).index_select(1, perm)
+
+        # normalize once upon creation rather than scaling every output
+        data.div_(math.sqrt(size))
 
-    def _create_permutation(self, weight: Parameter) -> Parameter:
-        data = torch.randperm(weight.size(0), generator=self.generator)
-        return Parameter(data, requires_grad=False)
+        data = data.to(device=device)  # no-op if already on offload device
+        weight = Parameter(data, requires_grad=self.scheme.requires_grad)
+
+        if shareable:
+            self.shared_weights[(size, dtype, device)] = weight
+
+        return weight
+
+    def _create_weight(self, size: int, dtype: dtype, device: device) -> Tensor:
+        return deterministic_hadamard_matrix(size, dtype, device)
+
+    def _create_permutation(self, size: int) -> Tensor:
+        return torch.randperm(size, generator=self.generator)
 
 
 class HadamardTransform(TransformBase):
     def __init__(
         self,
         weight: Parameter,
-        perm: Optional[Parameter],
         args: TransformArgs,
         module_type: type[torch.nn.Module],
     ):
         super().__init__()
-        self.weight = weight
-        self.perm = perm
+        self.weight = weight  # normalized, and permuted if the scheme is randomized
         self.args = args
         self.module_type = module_type
-        self._scale = math.sqrt(weight.size(0))
+        self._location = args.location
 
     def forward(self, value: Tensor) -> Tensor:
         weight = self.weight
 
-        if self.perm is not None:
-            weight = weight[self.perm][:, self.perm]
-
+        # inverse is toggled by `right_inverse`, so it is read on every call
         if self.args.inverse:
             weight = weight.T
- 
-        return apply_transform_weight(
-            weight, value, self.args.location, self.module_type
-        ) / self._scale
+
+        return apply_transform_weight(weight, value, self._location, self.module_type)
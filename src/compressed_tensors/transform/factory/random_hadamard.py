@@ -14,8 +14,7 @@
 
 from compressed_tensors.transform import HadamardFactory, TransformFactory
 from compressed_tensors.transform.utils.hadamard import random_hadamard_matrix
-from torch import device, dtype
-from torch.nn import Parameter
+from torch import Tensor, device, dtype
 
 
 @TransformFactory.register("random-hadamard")
@@ -28,14 +27,7 @@ class RandomHadamardFactory(HadamardFactory):
     :param seed: random seed used to transform weight randomization
     """
 
-    def _create_weight(
-        self,
-        size: int,
-        dtype: dtype,
-        device: device,
-        construct_device: device,
-    ) -> Parameter:
-        # construct on execution device, cache on offload device
-        data = random_hadamard_matrix(size, dtype, construct_device, self.generator)
-        data = data.to(device=device)
-        return Parameter(data, requires_grad=self.scheme.requires_grad)
+    _deterministic_weight = False
+
+    def _create_weight(self, size: int, dtype: dtype, device: device) -> Tensor:
+        return random_hadamard_matrix(size, dtype, device, self.generator)
@@ -53,13 +53,18 @@ def deterministic_hadamard_matrix(
     if size != 2**log2:
         raise ValueError("Cannot construct deterministic hadamard of size != 2^n")
 
-    H = torch.tensor([[1]], dtype=dtype, device=device)
-
-    # Sylvester's construction
-    for _ in range(log2):
-        H = torch.vstack((torch.hstack((H, H)), torch.hstack((H, -H))))
-
-    return H
+    # entries are +-1, so construct in int8 and cast once at the end
+    H = torch.empty((size, size), dtype=torch.int8, device=device)
+    H[0, 0] = 1
+
+    # Sylvester's construction, written in place to avoid intermediate allocations
+    for n in (2**i for i in range(log2)):
+        block = H[:n, :n]
+        H[:n, n : 2 * n].copy_(block)
+        H[n : 2 * n, :n].copy_(block)
+        H[n : 2 * n, n : 2 * n].copy_(block).neg_()
+
+    return H.to(dtype=dtype)
 
 
 def random_hadamard_matrix(
@@ -19,6 +19,7 @@ import pytest
 import torch
 from compressed_tensors.quantization.lifecycle.forward import (
     _process_quantization,
+    _quantize,
     dequantize,
     forward_quantize,
     quantize,
@@ -30,6 +31,7 @@ from compressed_tensors.quantization.lifecycle.initialize import (
 from compressed_tensors.quantization.quant_args import (
     QuantizationArgs,
     QuantizationStrategy,
+    round_to_quantized_type,
 )
 from compressed_tensors.quantization.quant_config import QuantizationStatus
 from compressed_tensors.quantization.utils.helpers import calculate_range
@@ -170,6 +172,33 @@ def test_quantize(num_bits, type, strategy, group_size, scale, zero_point, g_idx
     )
 
 
+@pytest.mark.parametrize(
+    "num_bits,type,rounded_dtype,dtype",
+    [
+        (8, "float", torch.float8_e4m3fn, torch.float8_e4m3fn),
+        (4, "float", torch.float32, torch.bfloat16),
+        (8, "int", torch.float32, torch.int8),
+    ],
+)
+def test_quantize_return_quantized_dtype(num_bits, type, rounded_dtype, dtype):
+    args = QuantizationArgs(num_bits=num_bits, type=type)
+    x = torch.randn((64, 128)) * 8
+
+    assert round_to_quantized_type(x, args).dtype == x.dtype
+    rounded = round_to_quantized_type(x, args, return_quantized_dtype=True)
+    assert rounded.dtype == rounded_dtype
+
+    # casting to a storage dtype matches rounding in the input dtype first
+    scale = torch.rand((64, 1)) + 0.1
+    q_min, q_max = calculate_range(args, x.device)
+    quantized = _quantize(x, scale, None, q_min, q_max, args, dtype=dtype)
+
+    clamped = torch.clamp(x / scale, q_min, q_max)
+    expected = round_to_quantized_type(clamped, args).to(dtype)
+    assert quantized.dtype == dtype
+    assert torch.equal(quantized.to(torch.float32), expected.to(torch.float32))
+
+
 @pytest.mark.parametrize(
     "num_bits,type,strategy,group_size,scale,zero_point,g_idx",
     [
@@ -27,6 +27,7 @@ from compressed_tensors.quantization import (
     QuantizationType,
 )
 from compressed_tensors.quantization.lifecycle.initialize import (
+    initialize_model_for_quantization,
     initialize_module_for_quantization,
 )
 from tests.testing_utils import requires_accelerate
@@ -99,6 +100,18 @@ def test_initialize_module_for_quantization(
     assert layer.quantization_status == QuantizationStatus.INITIALIZED
 
 
+def test_initialize_module_for_quantization_no_args(layer):
+    quantization_scheme = QuantizationScheme(targets=["Linear"])
+
+    initialize_module_for_quantization(layer, quantization_scheme)
+
+    # forward is left unwrapped, but the module is still initialized
+    assert "forward" not in layer.__dict__
+    assert layer.forward.__func__ is Linear.forward
+    assert layer.quantization_scheme == quantization_scheme
+    assert layer.quantization_status == QuantizationStatus.INITIALIZED
+
+
 @requires_accelerate()
 @pytest.mark.parametrize(
     "weights,input_activations",
@@ -251,3 +264,62 @@ def test_initialize_quantization_parameters(weights, input_activations):
             assert getattr(layer, f"{q_param_name}_g_idx").shape == (
                 layer.weight.shape[1],
             )
+
+
+def test_initialize_model_for_quantization():
+    quantization_scheme = QuantizationScheme(
+        targets=["Linear"],
+        weights=QuantizationArgs(num_bits=NUM_BITS, symmetric=True),
+        input_activations=QuantizationArgs(num_bits=NUM_BITS, symmetric=True),
+    )
+    model = torch.nn.Sequential(Linear(4, 4), torch.nn.ReLU(), Linear(4, 4))
+    model[0].quantization_scheme = quantization_scheme
+    model[2].quantization_scheme = quantization_scheme
+
+    initialize_model_for_quantization(model)
+
+    for layer in (model[0], model[2]):
+        assert layer.quantization_status == QuantizationStatus.INITIALIZED
+        for name in ("weight_scale", "weight_zero_point", "input_scale"):
+            assert getattr(layer, name).device == layer.weight.device
+    assert not hasattr(model[1], "quantization_status")
+
+
+def test_initialize_model_for_quantization_multiple_devices():
+    quantization_scheme = QuantizationScheme(
+        targets=["Linear"],
+        weights=QuantizationArgs(num_bits=NUM_BITS, symmetric=True),
+    )
+    model = torch.nn.Sequential(Linear(4, 4), Linear(4, 4, device="meta"))
+    for layer in model:
+        layer.quantization_scheme = quantization_scheme
+
+    initialize_model_for_quantization(model)
+
+    # qparams are initialized on the device of each layer
+    for layer in model:
+        assert layer.weight_scale.device == layer.weight.device
+        assert layer.weight_zero_point.device == layer.weight.device
+
+
+@requires_accelerate()
+def test_initialize_model_for_quantization_offloaded():
+    from accelerate.hooks import attach_align_device_hook
+    from compressed_tensors.utils import has_offloaded_params
+
+    quantization_scheme = QuantizationScheme(
+        targets=["Linear"],
+        weights=QuantizationArgs(num_bits=NUM_BITS, symmetric=True),
+    )
+    model = torch.nn.Sequential(Linear(4, 4), Linear(4, 4))
+    for layer in model:
+        layer.quantization_scheme = quantization_scheme
+    attach_align_device_hook(model, offload=True)
+
+    initialize_model_for_quantization(model)
+
+    for layer in model:
+        # hooks are restored and new parameters are offloaded
+        assert has_offloaded_params(layer)
+        assert "weight_scale" in layer._hf_hook.weights_map
+        assert layer.quantization_status == QuantizationStatus.INITIALIZED
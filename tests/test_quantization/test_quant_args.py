@@ -13,11 +13,14 @@
 # limitations under the License.
 
 import pytest
+import torch
 from compressed_tensors.quantization import (
+    FP4_E2M1_DATA,
     ActivationOrdering,
     QuantizationArgs,
     QuantizationStrategy,
     QuantizationType,
+    round_to_quantized_type,
 )
 from pydantic import ValidationError
 
@@ -62,6 +65,10 @@ def test_block():
     assert block.block_structure == [2, 4]
     assert block.block_structure != kwargs["block_structure"]  # "2x4" != [2, 4]
 
+    for invalid in ("128", "2x4x8", "axb"):
+        with pytest.raises(ValueError):
+            QuantizationArgs(strategy="block", block_structure=invalid)
+
 
 def test_infer_strategy():
     args = QuantizationArgs(group_size=128)
@@ -155,3 +162,49 @@ def test_invalid():
         QuantizationArgs(strategy="invalid")
     with pytest.raises(ValidationError):
         QuantizationArgs(strategy=QuantizationStrategy.GROUP)
+
+
+def test_cast_to_fp4():
+    x = torch.tensor(
+        [0.0, 0.25, 0.3, 0.75, 1.25, 1.5, 1.75, 2.5, 3.4, 3.5, 5.0, 5.1, 100.0]
+    )
+    expected = torch.tensor(
+        [0.0, 0.0, 0.5, 1.0, 1.0, 1.5, 2.0, 2.0, 3.0, 4.0, 4.0, 6.0, 6.0]
+    )
+    assert torch.equal(FP4_E2M1_DATA.cast_to_fp4(x), expected)
+    assert torch.equal(FP4_E2M1_DATA.cast_to_fp4(-x), -expected)
+
+
+def test_zp_dtype():
+    assert QuantizationArgs(num_bits=4, type="int").zp_dtype == torch.int8
+    assert QuantizationArgs(num_bits=8, type="float").zp_dtype == torch.float8_e4m3fn
+
+    fp4 = QuantizationArgs(num_bits=4, type="float")
+    assert fp4.is_fp4
+    assert fp4.zp_dtype == torch.float8_e4m3fn
+
+    # reflects the current field values, including after copies with updates
+    int4 = QuantizationArgs(num_bits=4, type="int")
+    assert int4.zp_dtype == torch.int8
+    fp4 = int4.model_copy(update={"type": "float"})
+    assert fp4.is_fp4
+    assert fp4.zp_dtype == torch.float8_e4m3fn
+
+
+def test_requires_zero_point():
+    args = QuantizationArgs(symmetric=True)
+    assert not args.requires_zero_point
+
+    # reflects fields which are modified after construction
+    args.symmetric = False
+    assert args.requires_zero_point
+
+
+@pytest.mark.parametrize("dtype", [torch.float32, torch.float16, torch.bfloat16])
+def test_round_to_fp8(dtype):
+    args = QuantizationArgs(num_bits=8, type="float")
+    x = (torch.randn(4, 16, 32) * 10).to(dtype)
+
+    rounded = round_to_quantized_type(x, args)
+    assert rounded.dtype == dtype
+    assert torch.equal(rounded, x.to(torch.float8_e4m3fn).to(dtype))
@@ -12,8 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import warnings
+
 import pytest
 from compressed_tensors.quantization import QuantizationArgs, QuantizationScheme
+from compressed_tensors.quantization.quant_scheme import (
+    PRESET_SCHEMES,
+    preset_name_to_scheme,
+)
 from pydantic import ValidationError
 
 
@@ -57,3 +63,59 @@ def test_defaults():
     assert output.weights is None
     assert output.input_activations is None
     assert output.output_activations is None
+
+
+def test_group_size_mismatch_warns_once():
+    weights = QuantizationArgs(strategy="group", group_size=96)
+    inputs = QuantizationArgs(strategy="group", group_size=48)
+
+    with pytest.warns(UserWarning, match="different group sizes"):
+        QuantizationScheme(
+            targets=["Linear"], weights=weights, input_activations=inputs
+        )
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        QuantizationScheme(
+            targets=["Linear"], weights=weights, input_activations=inputs
+        )
+
+
+def test_preset_name_to_scheme():
+    scheme = preset_name_to_scheme("w4a16", ["Linear"])
+    assert scheme == QuantizationScheme(targets=["Linear"], **PRESET_SCHEMES["W4A16"])
+
+    # repeated calls return independent copies
+    other = preset_name_to_scheme("W4A16", ["re:.*q_proj"])
+    assert other.targets == ["re:.*q_proj"]
+    assert scheme.targets == ["Linear"]
+    assert other.weights is not scheme.weights
+    other.weights.observer = "mse"
+    other.weights.observer_kwargs["maxshrink"] = 0.5
+    assert scheme.weights.observer == "minmax"
+    assert scheme.weights.observer_kwargs == {}
+    assert PRESET_SCHEMES["W4A16"]["weights"].observer_kwargs == {}
+    fresh = preset_name_to_scheme("W4A16", ["Linear"])
+    assert fresh.weights.observer == "minmax"
+    assert fresh.weights.observer_kwargs == {}
+
+    with pytest.raises(KeyError):
+        preset_name_to_scheme("not_a_preset", ["Linear"])
+
+    # targets are validated as a list of strings
+    with pytest.raises(ValidationError):
+        preset_name_to_scheme("W8A8", "Linear")
+    with pytest.raises(ValidationError):
+        preset_name_to_scheme("W8A8", [1])
+
+
+def test_preset_name_to_scheme_modified_preset(monkeypatch):
+    # replaced and edited presets are reflected in new schemes
+    monkeypatch.setitem(
+        PRESET_SCHEMES, "W4A16", dict(weights=QuantizationArgs(num_bits=8))
+    )
+    assert preset_name_to_scheme("W4A16", ["Linear"]).weights.num_bits == 8
+
+    inputs = QuantizationArgs(num_bits=8, dynamic=True, strategy="token")
+    monkeypatch.setitem(PRESET_SCHEMES["W8A16"], "input_activations", inputs)
+    assert preset_name_to_scheme("W8A16", ["Linear"]).input_activations == inputs
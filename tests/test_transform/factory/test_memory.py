@@ -81,6 +81,59 @@ def test_memory_sharing(type, randomized, requires_grad, offload=False):
         assert weight_to_count[size_to_weight[8]] == 3
 
 
+def test_memory_sharing_across_schemes():
+    model = TransformableModel(2, 2, 4, 4, 8, 8)
+
+    # deterministic weights are shared between factories
+    config = TransformConfig(
+        config_groups={
+            "input": TransformScheme(
+                type="hadamard",
+                apply=[TransformArgs(targets="Linear", location="input")],
+            ),
+            "output": TransformScheme(
+                type="hadamard",
+                apply=[TransformArgs(targets="Linear", location="output")],
+            ),
+        }
+    )
+    apply_transform_config(model, config)
+
+    weights = [m.weight for m in model.modules() if isinstance(m, TransformBase)]
+    weight_to_count = Counter(weights)
+    size_to_weight = {weight.size(0): weight for weight in weight_to_count}
+
+    assert len(weight_to_count) == len(size_to_weight) == 3
+    assert weight_to_count[size_to_weight[2]] == 3
+    assert weight_to_count[size_to_weight[4]] == 4
+    assert weight_to_count[size_to_weight[8]] == 3
+
+
+def test_memory_not_shared_across_models():
+    config = TransformConfig(
+        config_groups={
+            "": TransformScheme(
+                type="hadamard",
+                apply=[TransformArgs(targets="Linear", location="input")],
+            )
+        }
+    )
+    model_a = TransformableModel(2, 4)
+    model_b = TransformableModel(2, 4)
+    apply_transform_config(model_a, config)
+    apply_transform_config(model_b, config)
+
+    # converting one model does not affect other models
+    model_a.to(torch.float16)
+    model_b(torch.rand(1, 2))
+
+    model_c = TransformableModel(2, 4)
+    apply_transform_config(model_c, config)
+    weights = [m.weight for m in model_c.modules() if isinstance(m, TransformBase)]
+    assert all(weight.dtype == torch.float32 for weight in weights)
+    model_c(torch.rand(1, 2))
+
+
 @requires_gpu
 @requires_accelerate()
 @pytest.mark.parametrize("type", ("hadamard", "random-hadamard"))